@@ -1,5 +1,5 @@
-import gzip
-import inspect
+import atexit
+import base64
 import json
 import logging
 import os
@@ -8,9 +8,52 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from types import MappingProxyType
 
 # Constants
 DATA_DIR = "data"
+CHROME_PROFILE_DIR = "cred/chrome_profile"
+SCROLL_TIMEOUT = 600
+# Assets the scraper never needs, CSS stays since the reviews pane needs it to scroll
+BLOCKED_URLS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff*",
+    "*maps/vt*",
+    "*streetview*",
+]
+SCROLL_IDLE_TIMEOUT = 3
+
+# Keeps scrolling the reviews inside the browser whenever new ones get added, and
+# resolves with the loaded count once all of them are there or nothing new shows up
+SCROLL_REVIEWS_SCRIPT = """
+const [container, scrollable, expectedDivs, idleTimeout, done] = arguments;
+let idleTimer = null;
+
+const finish = () => {
+    observer.disconnect();
+    clearTimeout(idleTimer);
+    done(container.childElementCount);
+};
+
+const scroll = () => {
+    if (container.childElementCount >= expectedDivs) {
+        finish();
+        return;
+    }
+    scrollable.scrollTop = scrollable.scrollHeight;
+    clearTimeout(idleTimer);
+    idleTimer = setTimeout(finish, idleTimeout);
+};
+
+const observer = new MutationObserver(scroll);
+observer.observe(container, { childList: true });
+scroll();
+"""
 
 
 class Config:
@@ -22,10 +65,9 @@ class Config:
 
 def install_requirements():
     try:
-        import brotli as _
         import inquirer as _
+        import orjson as _
         import selenium as _
-        import seleniumwire as _
     except ImportError:
         print(
             f"{Config.YELLOW}Required libraries not found. Installing...{Config.RESET}"
@@ -37,10 +79,8 @@ def install_requirements():
                 "pip",
                 "install",
                 "selenium",
-                "selenium-wire",
-                "blinker==1.7.0",
-                "brotli",
                 "inquirer",
+                "orjson",
             ]
         )
         print(
@@ -50,32 +90,71 @@ def install_requirements():
 
 install_requirements()
 
-import brotli
+import orjson
+from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from seleniumwire import webdriver as wire_webdriver
+
+# google-re2 (optional) scans large responses in linear time, stock re works the same
+try:
+    import re2 as url_re
+except ImportError:
+    url_re = re
+
+_SHORT_URL_RE = url_re.compile(r'https://maps\.app\.goo\.gl/[^"\'}\s]*')
+_REPORT_URL_RE = url_re.compile(
+    r'https://www\.google\.com/local/review/rap/report\?postId[^"\'}\s]*'
+)
+
+# Escaped sequences found in the review URLs, double escaped ones first
+_DECODE_MAP = {
+    "\\\\u003d": "=",
+    "\\\\u0026": "&",
+    "\\u003d": "=",
+    "\\u0026": "&",
+}
+_DECODE_RE = re.compile("|".join(map(re.escape, _DECODE_MAP)))
+
+# Chrome with performance logging so network responses can be read over CDP
+_CHROME_OPTIONS = Options()
+_CHROME_OPTIONS.add_argument("--disable-notifications")
+_CHROME_OPTIONS.add_argument(f"--user-data-dir={os.path.abspath(CHROME_PROFILE_DIR)}")
+_CHROME_OPTIONS.add_argument("--blink-settings=imagesEnabled=false")
+_CHROME_OPTIONS.add_argument("--disable-features=IsolateOrigins,site-per-process")
+_CHROME_OPTIONS.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
 
 class ColoredFormatter(logging.Formatter):
-    COLORS = {
-        "DEBUG": "\033[94m",
-        "INFO": "\033[92m",
-        "WARNING": "\033[93m",
-        "ERROR": "\033[91m",
-        "CRITICAL": "\033[95m",
-        "RESET": "\033[0m",
-    }
+    COLORS = MappingProxyType(
+        {
+            "DEBUG": "\033[94m",
+            "INFO": "\033[92m",
+            "WARNING": "\033[93m",
+            "ERROR": "\033[91m",
+            "CRITICAL": "\033[95m",
+            "RESET": "\033[0m",
+        }
+    )
+
+    # Prefix/suffix per level number, so formatting a record is a single lookup
+    _WRAP = MappingProxyType(
+        {
+            logging.getLevelName(level): (color, Config.RESET)
+            for level, color in COLORS.items()
+            if level != "RESET"
+        }
+    )
+    _DEFAULT_WRAP = (Config.RESET, Config.RESET)
 
     def format(self, record):
-        log_message = super().format(record)
-        return f"{self.COLORS.get(record.levelname, self.COLORS['RESET'])}{log_message}{self.COLORS['RESET']}"
+        prefix, suffix = self._WRAP.get(record.levelno, self._DEFAULT_WRAP)
+        return f"{prefix}{super().format(record)}{suffix}"
 
 
 def setup_logger(log_file=None):
-    caller_script = inspect.stack()[2].filename
-    script_name = os.path.splitext(os.path.basename(caller_script))[0]
+    script_name = os.path.splitext(os.path.basename(__file__))[0]
     logger_name = script_name
     date = datetime.now().strftime("%m_%d")
 
@@ -113,9 +192,14 @@ def setup_logger(log_file=None):
     return logger
 
 
+_LOGGER = None
+
+
 def log_message(message, level="INFO"):
-    logger = setup_logger()
-    getattr(logger, level.lower())(message)
+    global _LOGGER
+    if _LOGGER is None:
+        _LOGGER = setup_logger()
+    getattr(_LOGGER, level.lower())(message)
 
 
 def choose_actions():
@@ -155,31 +239,65 @@ def ensure_data_directory():
 
 def decode_url(url):
     """Decode Google review URLs"""
-    url = url.replace("\\\\u003d", "=")
-    url = url.replace("\\\\u0026", "&")
-    url = url.replace("\\u003d", "=")
-    url = url.replace("\\u0026", "&")
-    return url
+    return _DECODE_RE.sub(lambda match: _DECODE_MAP[match.group(0)], url)
 
 
 def extract_short_urls_from_response(response_text):
-    """Extract Google review URLs from response text using regex"""
-    urls = set()
-    pattern = re.compile(r'https://maps\.app\.goo\.gl/[^"\'}\s]*')
-    matches = pattern.findall(response_text)
-    urls.update(matches)
-    return [decode_url(url) for url in urls]
+    """Extract Google review URLs from the response using regex"""
+    return map(decode_url, set(_SHORT_URL_RE.findall(response_text)))
 
 
 def extract_report_urls_from_response(response_text):
-    """Extract Google review URLs from response text using regex"""
-    urls = set()
-    pattern = re.compile(
-        r'https://www\.google\.com/local/review/rap/report\?postId[^"\'}\s]*'
-    )
-    matches = pattern.findall(response_text)
-    urls.update(matches)
-    return [decode_url(url) for url in urls]
+    """Extract Google review URLs from the response using regex"""
+    return map(decode_url, set(_REPORT_URL_RE.findall(response_text)))
+
+
+def create_driver():
+    """Start Chrome and block the assets the scraper doesn't need"""
+    driver = webdriver.Chrome(options=_CHROME_OPTIONS)
+    driver.set_script_timeout(SCROLL_TIMEOUT)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    return driver
+
+
+_DRIVER = None
+
+
+def get_driver():
+    """Return the shared Chrome driver, starting it on first use"""
+    global _DRIVER
+    if _DRIVER is None:
+        _DRIVER = create_driver()
+        atexit.register(_DRIVER.quit)
+    return _DRIVER
+
+
+def iter_response_bodies(driver, url_part):
+    """
+    Yield the bodies of the responses whose URL contains `url_part`.
+    Chrome already decompressed and decoded them, so they are scanned as is
+    """
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"] != "Network.responseReceived":
+            continue
+        if url_part not in message["params"]["response"]["url"]:
+            continue
+
+        try:
+            response = driver.execute_cdp_cmd(
+                "Network.getResponseBody",
+                {"requestId": message["params"]["requestId"]},
+            )
+        except Exception as e:
+            log_message(f"Error fetching response body: {str(e)}", "ERROR")
+            continue
+
+        if response["base64Encoded"]:
+            yield base64.b64decode(response["body"]).decode("utf-8", "replace")
+        else:
+            yield response["body"]
 
 
 def scroll_through_available_reviews(driver, url):
@@ -187,14 +305,16 @@ def scroll_through_available_reviews(driver, url):
 
     try:
         log_message(f"Navigating to user reviews: {url}", "INFO")
+        # Drop the responses left over from previously opened pages
+        driver.get_log("performance")
         driver.get(url)
         wait = WebDriverWait(driver, 20)
 
         reviews_xpath = '//*[@aria-label="Reviews"]'
-        total_reviews_element = wait.until(
+        scrollable_div = wait.until(
             EC.presence_of_element_located((By.XPATH, reviews_xpath))
         )
-        total_reviews_wait = WebDriverWait(total_reviews_element, 20)
+        total_reviews_wait = WebDriverWait(scrollable_div, 20)
 
         # Get total reviews count
         total_reviews_element = total_reviews_wait.until(
@@ -211,56 +331,41 @@ def scroll_through_available_reviews(driver, url):
         reviews_container = total_reviews_wait.until(
             lambda element: element.find_element(By.XPATH, "./div[2]")
         )
-        scrollable_div = wait.until(
-            EC.presence_of_element_located((By.XPATH, reviews_xpath))
-        )
 
-        # Scroll through reviews
-        last_current_div = 0
-        max_scroll = 0
-        while True:
-            current_divs = len(reviews_container.find_elements(By.XPATH, "./div"))
-            if last_current_div == current_divs:
-                time.sleep(1)
-                max_scroll += 1
-            if current_divs >= expected_total_divs or max_scroll >= 10:
-                break
-
-            max_scroll = 0
-            last_current_div = current_divs
-            driver.execute_script(
-                "arguments[0].scrollTop = arguments[0].scrollHeight",
-                scrollable_div,
-            )
-            time.sleep(1)
+        # Scroll through reviews, returns right away if they are all loaded already
+        loaded_divs = driver.execute_async_script(
+            SCROLL_REVIEWS_SCRIPT,
+            reviews_container,
+            scrollable_div,
+            expected_total_divs,
+            SCROLL_IDLE_TIMEOUT * 1000,
+        )
+        log_message(
+            f"Loaded {loaded_divs} out of {expected_total_divs} review elements",
+            "DEBUG",
+        )
 
     except Exception as e:
         log_message(f"Error during review extraction: {str(e)}", "ERROR")
 
 
-def intercept_review_requests(user_id):
+def intercept_review_requests(user_id, driver=None):
     """Process and extract direct review report URLs for a given user ID"""
     url = f"https://www.google.com/maps/contrib/{user_id}/reviews"
     all_review_urls = set()
 
-    # Setup Chrome driver with selenium-wire
-    chrome_options = Options()
-    chrome_options.add_argument("--disable-notifications")
-    driver = wire_webdriver.Chrome(options=chrome_options)
+    driver = driver or get_driver()
 
     try:
         scroll_through_available_reviews(driver, url)
 
-        # Process network requests
-        for request in driver.requests:
-            if request.response and "/locationhistory/preview/mas" in request.url:
-                try:
-                    response_data = brotli.decompress(request.response.body)
-                    decoded_str = response_data.decode("utf-8")
-                    urls = extract_report_urls_from_response(decoded_str)
-                    all_review_urls.update(urls)
-                except Exception as e:
-                    log_message(f"Error processing response: {str(e)}", "ERROR")
+        # Process network responses
+        for body in iter_response_bodies(driver, "/locationhistory/preview/mas"):
+            try:
+                urls = extract_report_urls_from_response(body)
+                all_review_urls.update(urls)
+            except Exception as e:
+                log_message(f"Error processing response: {str(e)}", "ERROR")
 
         # Process initial state
         app_initial_state = driver.execute_script(
@@ -276,19 +381,13 @@ def intercept_review_requests(user_id):
         log_message(f"Error during review extraction: {str(e)}", "ERROR")
         return []
 
-    finally:
-        driver.quit()
-
 
-def intercept_review_short_url_requests(user_id):
+def intercept_review_short_url_requests(user_id, driver=None):
     """Process and extract short review URLs for a given user ID"""
     url = f"https://www.google.com/maps/contrib/{user_id}/reviews"
     short_review_urls = set()
 
-    # Setup Chrome driver with selenium-wire
-    chrome_options = Options()
-    chrome_options.add_argument("--disable-notifications")
-    driver = wire_webdriver.Chrome(options=chrome_options)
+    driver = driver or get_driver()
 
     try:
         scroll_through_available_reviews(driver, url)
@@ -319,15 +418,13 @@ def intercept_review_short_url_requests(user_id):
                     f"Unabled to generate short link for the button id: '{button.id}', error: {str(e)}"
                 )
 
-        # Process network requests
-        for request in driver.requests:
-            if request.response and "shorturl" in request.url:
-                try:
-                    decoded_str = gzip.decompress(request.response.body).decode("utf-8")
-                    urls = extract_short_urls_from_response(decoded_str)
-                    short_review_urls.update(urls)
-                except Exception as e:
-                    log_message(f"Error processing response: {str(e)}", "ERROR")
+        # Process network responses
+        for body in iter_response_bodies(driver, "shorturl"):
+            try:
+                urls = extract_short_urls_from_response(body)
+                short_review_urls.update(urls)
+            except Exception as e:
+                log_message(f"Error processing response: {str(e)}", "ERROR")
 
         log_message(f"Found {len(short_review_urls)} unique review URLs", "INFO")
         return list(short_review_urls)
@@ -336,9 +433,6 @@ def intercept_review_short_url_requests(user_id):
         log_message(f"Error during review extraction: {str(e)}", "ERROR")
         return []
 
-    finally:
-        driver.quit()
-
 
 def main():
     ensure_data_directory()
@@ -365,11 +459,13 @@ def main():
 
     if review_urls:
         output_file = os.path.join(DATA_DIR, f"{file_prefix}_{user_id}.{file_suffix}")
-        with open(output_file, "w") as f:
-            if file_suffix == "json":
-                json.dump(review_urls, f)
-            else:
-                f.write("\n".join(review_urls))
+        if file_suffix == "json":
+            output = orjson.dumps(review_urls)
+        else:
+            output = "\n".join(review_urls).encode("utf-8")
+
+        with open(output_file, "wb") as f:
+            f.write(output)
         log_message(
             f"Successfully saved {len(review_urls)} review URLs to {output_file}. for action: '{action}'",
             "INFO",
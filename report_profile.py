@@ -1,12 +1,15 @@
 import hashlib
 import json
 import logging
+import math
 import os
 import subprocess
 import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from types import MappingProxyType
 
 
 # Color configurations for terminal output
@@ -20,18 +23,30 @@ class Config:
 
 
 class ColoredFormatter(logging.Formatter):
-    COLORS = {
-        "DEBUG": Config.BLUE,
-        "INFO": Config.GREEN,
-        "WARNING": Config.YELLOW,
-        "ERROR": Config.RED,
-        "CRITICAL": Config.MAGENTA,
-        "RESET": Config.RESET,
-    }
+    COLORS = MappingProxyType(
+        {
+            "DEBUG": Config.BLUE,
+            "INFO": Config.GREEN,
+            "WARNING": Config.YELLOW,
+            "ERROR": Config.RED,
+            "CRITICAL": Config.MAGENTA,
+            "RESET": Config.RESET,
+        }
+    )
+
+    # Prefix/suffix per level number, so formatting a record is a single lookup
+    _WRAP = MappingProxyType(
+        {
+            logging.getLevelName(level): (color, Config.RESET)
+            for level, color in COLORS.items()
+            if level != "RESET"
+        }
+    )
+    _DEFAULT_WRAP = (Config.RESET, Config.RESET)
 
     def format(self, record):
-        log_message = super().format(record)
-        return f"{self.COLORS.get(record.levelname, self.COLORS['RESET'])}{log_message}{self.COLORS['RESET']}"
+        prefix, suffix = self._WRAP.get(record.levelno, self._DEFAULT_WRAP)
+        return f"{prefix}{super().format(record)}{suffix}"
 
 
 def install_requirements():
@@ -65,34 +80,48 @@ install_requirements()
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
 # Constants
 BATCH_SIZE = 100
+PAGE_SIZE = 100
+MAX_WORKERS = 8
 GEELARK_BASE_URL = "https://openapi.geelark.com/open/v1"
 APP_ID = os.getenv("GEELARK_APP_ID")
 APP_KEY = os.getenv("GEELARK_APP_KEY")
+APP_ID_BYTES = (APP_ID or "").encode()
+APP_KEY_BYTES = (APP_KEY or "").encode()
 
 SELECTED_PHONES_FILE = "cred/selected_phones.json"
 PROCESSED_DATA_FILE = "cred/processed_data.json"
 
+# Shared session so every API call reuses the same keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS)
+)
+
 
 # Utility Functions
 def generate_headers():
     """Generate required headers for Geelark API requests"""
     traceId = str(uuid.uuid4())
-    ts = int(time.time() * 1000)
+    ts = str(time.time_ns() // 1_000_000)
     nonce = traceId[:6]
 
-    # Generate signature
-    sign_str = f"{APP_ID}{traceId}{ts}{nonce}{APP_KEY}"
-    sign = hashlib.sha256(sign_str.encode()).hexdigest().upper()
+    # Generate signature, the nonce is just the first bytes of the trace id
+    trace_bytes = traceId.encode()
+    sign_bytes = b"".join(
+        (APP_ID_BYTES, trace_bytes, ts.encode(), trace_bytes[:6], APP_KEY_BYTES)
+    )
+    sign = hashlib.sha256(sign_bytes).hexdigest().upper()
 
     return {
         "appId": APP_ID,
         "traceId": traceId,
-        "ts": str(ts),
+        "ts": ts,
         "nonce": nonce,
         "sign": sign,
         "Content-Type": "application/json",
@@ -134,22 +163,23 @@ def setup_logger(log_file=None):
     return logger
 
 
+# Built once at import, before any worker thread can log
+_LOGGER = setup_logger()
+
+
 def log_message(message, level="INFO"):
-    logger = setup_logger()
-    getattr(logger, level.lower())(message)
+    getattr(_LOGGER, level.lower())(message)
 
 
 def get_phone_list():
     """Fetch list of all the available from Geelark"""
-    all_phones = []
-    page_id = 1
 
-    def get_phone_page(page=1, page_size=100):
+    def get_phone_page(page=1, page_size=PAGE_SIZE):
         url = f"{GEELARK_BASE_URL}/phone/list"
         payload = {"page": page, "pageSize": page_size}
 
         try:
-            response = requests.post(url, headers=generate_headers(), json=payload)
+            response = _SESSION.post(url, headers=generate_headers(), json=payload)
             response.raise_for_status()
 
             items = response.json().get("data", {}).get("items", [])
@@ -160,16 +190,17 @@ def get_phone_list():
             log_message(f"Error fetching phone list: {e}", "ERROR")
             return [], 0
 
-    while True:
-        phones, total = get_phone_page(page=page_id)
-        all_phones = all_phones + phones
+    all_phones, total = get_phone_page(page=1)
+    if total <= len(all_phones):
+        return all_phones
 
-        if total == 0:
-            break
-        elif total <= len(all_phones):
-            break
+    # The total is known after the first page, so fetch the rest concurrently
+    page_count = math.ceil(total / PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pages = executor.map(get_phone_page, range(2, page_count + 1))
 
-        page_id += 1
+        for phones, _ in pages:
+            all_phones.extend(phones)
 
     return all_phones
 
@@ -183,6 +214,7 @@ def get_selected_phones(all_phones):
         if not chosen_phones:
             return all_phones
 
+        chosen_phones = set(chosen_phones)
         selected_phones = [
             phone for phone in all_phones if phone["serialName"] in chosen_phones
         ]
@@ -197,7 +229,7 @@ def start_phones(phone_ids):
     payload = {"ids": phone_ids}
 
     try:
-        response = requests.post(url, headers=generate_headers(), json=payload)
+        response = _SESSION.post(url, headers=generate_headers(), json=payload)
         response.raise_for_status()
 
         data = response.json().get("data", {})
@@ -213,7 +245,7 @@ def stop_phones(phone_ids):
     payload = {"ids": phone_ids}
 
     try:
-        response = requests.post(url, headers=generate_headers(), json=payload)
+        response = _SESSION.post(url, headers=generate_headers(), json=payload)
         response.raise_for_status()
         data = response.json().get("data", {})
         return data.get("successAmount", 0), data.get("failDetails", [])
@@ -222,6 +254,18 @@ def stop_phones(phone_ids):
         return [], []
 
 
+def run_batches(func, batches):
+    """Call the phone API for every batch concurrently, yielding results as they finish"""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(func, [phone["id"] for phone in batch])
+            for batch in batches
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
 def choose_actions():
     """
     Displays a graphical interface to for user to choose the script options
@@ -287,11 +331,8 @@ def main():
             for i in range(0, len(selected_phones), BATCH_SIZE)
         ]
 
-        for batch in batches:
-            phone_ids = [phone["id"] for phone in batch]
-
-            if action == "Start All Phones":
-                started_phones, failed_phones = start_phones(phone_ids)
+        if action == "Start All Phones":
+            for started_phones, failed_phones in run_batches(start_phones, batches):
                 log_message(
                     f"Successfully started {len(started_phones)} phones, Failed to start {len(failed_phones)} phones"
                 )
@@ -299,18 +340,18 @@ def main():
                 if len(failed_phones) > 0:
                     log_failed_devices(failed_phones, selected_phones)
 
-            elif action == "Stop All Phones":
-                stoped_phones_len, failed_phones = stop_phones(phone_ids)
+        elif action == "Stop All Phones":
+            for stoped_phones_len, failed_phones in run_batches(stop_phones, batches):
                 log_message(
                     f"Successfully stoped {stoped_phones_len} phones, Failed to stop {len(failed_phones)} phones"
                 )
 
                 if len(failed_phones) > 0:
                     log_failed_devices(failed_phones, selected_phones)
-            elif action == "Bulk - Install Application":
-                print("Not yet implemented")
-            elif action == "Bulk - Uninstall Application":
-                print("Not yet implemented")
+        elif action == "Bulk - Install Application":
+            print("Not yet implemented")
+        elif action == "Bulk - Uninstall Application":
+            print("Not yet implemented")
 
     except KeyboardInterrupt:
         log_message("Shutting down gracefully...", "INFO")
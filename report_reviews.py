@@ -1,12 +1,18 @@
-import inspect
+import argparse
+import atexit
+import functools
 import json
 import logging
 import os
 import random
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 
 
 # Color configurations for terminal output
@@ -20,75 +26,178 @@ class Config:
 
 
 # Configure required libraries
+REQUIREMENTS = ["inquirer", "orjson", "python-dotenv", "requests", "selenium"]
+REQUIREMENTS_OK_FILE = "cred/.deps_ok"
+
+
 def install_requirements():
+    # Skip the check once these exact requirements were confirmed installed
+    try:
+        with open(REQUIREMENTS_OK_FILE, "r") as f:
+            if f.read() == " ".join(REQUIREMENTS):
+                return
+    except OSError:
+        pass
+
     try:
         import dotenv as _
         import inquirer as _
+        import orjson as _
         import requests as _
         import selenium as _
     except ImportError:
-        subprocess.check_call(
-            [
-                sys.executable,
-                "-m",
-                "pip",
-                "install",
-                "inquirer",
-                "python-dotenv",
-                "requests",
-                "selenium",
-            ]
-        )
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *REQUIREMENTS])
         print(
             f"{Config.GREEN}Required libraries installed successfully.{Config.RESET}\n"
         )
 
+    os.makedirs("cred", exist_ok=True)
+    with open(REQUIREMENTS_OK_FILE, "w") as f:
+        f.write(" ".join(REQUIREMENTS))
+
 
 install_requirements()
 
 import requests
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from urllib3.util.retry import Retry
+
+# selenium.webdriver imports every browser's driver, so it's only imported once a
+# profile is actually automated. Locators use the raw By.CSS_SELECTOR value.
+CSS_SELECTOR = "css selector"
+
+# orjson parses and dumps in C, fall back to the stdlib json if it's missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 load_dotenv()
 
 IS_HEADLESS = False
 PROFILE_LIMIT = 100
+MAX_WORKERS = 8
+PROFILE_WORKERS = 4  # Default number of profiles automated at the same time
+PROFILE_STARTS = 2  # Dolphin profile starts allowed at the same time
+POOL_SIZE = 16
+# (connect, read) timeouts in seconds
+API_TIMEOUT = (3, 10)  # Dolphin cloud API
+LOCAL_API_TIMEOUT = (3, 5)  # Dolphin local API
+PROFILE_START_TIMEOUT = (3, 60)  # The start call returns once the browser is up
+RECAPTCHA_TIMEOUT = 5 * 60
 API_URL = "https://dolphin-anty-api.com"
 BASE_URL = os.getenv("DOLPHIN_BASE_URL")
 API_KEY = os.getenv("DOLPHIN_API_KEY")
 SELECTED_PROFILES_FILE = "cred/selected_profiles.json"
 PROCESSED_DATA_FILE = "cred/processed_browser_data.json"
+PROFILES_CACHE_FILE = "cred/profiles_cache.json"
+PROFILES_CACHE_TTL = 10 * 60
+REPORTED_REVIEWS_FILE = "cred/reported_{profile_id}.jsonl"
+REPORT_DIRS = (".", "data")
+PROCESSED_FLUSH_EVERY = 10  # Profiles between resume checkpoint writes
+
+_SAVE_LOCK = threading.Lock()
+_PROCESSED_STATE = {"profile_id": None, "input_file": None}
+_PROCESSED_DIRTY = False
+_PROCESSED_PENDING = 0
+_STOP_EVENT = threading.Event()
+_START_SEMAPHORE = threading.Semaphore(PROFILE_STARTS)
+_PROFILES_CACHE = None
+_PROFILES_CACHE_EXPIRES = 0
+
+# Locators of the Google sign in and review report pages
+ACCOUNT_BUTTON = (
+    CSS_SELECTOR,
+    "#yDmH0d > div.gfM9Zd > div.tTmh9.NQ5OL > div.SQNfcc.WbALBb > div > div > div.Anixxd > div > div > div > form > span > section > div > div > div > div > ul > li.aZvCDf.oqdnae.W7Aapd.zpCp3.SmR8 > div",
+)
+PASSWORD_FIELD = (
+    CSS_SELECTOR,
+    "#password > div.aCsJod.oJeWuf > div > div.Xb9hP > input",
+)
+NOT_NOW_BUTTON = (
+    CSS_SELECTOR,
+    "#yDmH0d > div.gfM9Zd > div.tTmh9.NQ5OL > div.SQNfcc.WbALBb > div > div > div.fby5Ed > div > div.SxkrO > div > div > button > span",
+)
+SPAM_BUTTON = (CSS_SELECTOR, "#yDmH0d > c-wiz > div > ul > li:nth-child(2) > a")
+OFFTOPIC_BUTTON = (CSS_SELECTOR, "#yDmH0d > c-wiz > div > ul > li:nth-child(1) > a")
+SUBMIT_BUTTON = (
+    CSS_SELECTOR,
+    "#yDmH0d > c-wiz.zQTmif.SSPGKf.eejsDc.BE677d > div > div.mhBSmf > div > div > button > span",
+)
+REPORT_FAILED_BUTTON = (
+    CSS_SELECTOR,
+    "#yDmH0d > c-wiz.zQTmif.SSPGKf.eejsDc.FDd2Le > div > div.mhBSmf > div > div > button > span",
+)
 
 # Create the cred Dir
 os.makedirs("cred", exist_ok=True)
 
+# Shared keep-alive session for both the Dolphin cloud and the local API
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
+)
+_adapter = HTTPAdapter(
+    pool_connections=POOL_SIZE,
+    pool_maxsize=POOL_SIZE,
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "POST"),
+    ),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+# Starting a profile launches a browser, so a start that was sent is never sent
+# again, only connection failures are retried. read=False lets a read timeout
+# surface as ReadTimeout instead of being wrapped into a ConnectionError.
+_START_SESSION = requests.Session()
+_START_SESSION.headers.update(_SESSION.headers)
+_start_adapter = HTTPAdapter(
+    max_retries=Retry(total=3, read=False, status=0, other=0, backoff_factor=0.3)
+)
+_START_SESSION.mount("http://", _start_adapter)
+_START_SESSION.mount("https://", _start_adapter)
+
 
 class ColoredFormatter(logging.Formatter):
-    COLORS = {
-        "DEBUG": Config.BLUE,
-        "INFO": Config.GREEN,
-        "WARNING": Config.YELLOW,
-        "ERROR": Config.RED,
-        "CRITICAL": Config.MAGENTA,
-        "RESET": Config.RESET,
-    }
+    COLORS = MappingProxyType(
+        {
+            "DEBUG": Config.BLUE,
+            "INFO": Config.GREEN,
+            "WARNING": Config.YELLOW,
+            "ERROR": Config.RED,
+            "CRITICAL": Config.MAGENTA,
+            "RESET": Config.RESET,
+        }
+    )
+
+    # Prefix/suffix per level number, so formatting a record is a single lookup
+    _WRAP = MappingProxyType(
+        {
+            logging.getLevelName(level): (color, Config.RESET)
+            for level, color in COLORS.items()
+            if level != "RESET"
+        }
+    )
+    _DEFAULT_WRAP = (Config.RESET, Config.RESET)
 
     def format(self, record):
-        log_message = super().format(record)
-        return f"{self.COLORS.get(record.levelname, self.COLORS['RESET'])}{log_message}{self.COLORS['RESET']}"
+        prefix, suffix = self._WRAP.get(record.levelno, self._DEFAULT_WRAP)
+        return f"{prefix}{super().format(record)}{suffix}"
 
 
 def setup_logger(log_file=None):
-    caller_script = inspect.stack()[2].filename
-    script_name = os.path.splitext(os.path.basename(caller_script))[0]
+    script_name = os.path.splitext(os.path.basename(__file__))[0]
     logger_name = script_name
     date = datetime.now().strftime("%m_%d")
     log_file = log_file or os.path.join("log", f"{script_name}_{date}.log")
@@ -124,6 +233,19 @@ def setup_logger(log_file=None):
     return logger
 
 
+@functools.lru_cache(maxsize=1)
+def find_report_files():
+    """Review report files in the report directories, sorted by name"""
+    # fetch_reviews.py saves its reports into data/, so only look there and in
+    # the working directory instead of walking the whole tree
+    paths = (
+        path.resolve()
+        for directory in REPORT_DIRS
+        for path in Path(directory).glob("review_report_*.json")
+    )
+    return tuple(sorted(paths, key=lambda path: path.name))
+
+
 def choose_file():
     """
     Displays a graphical interface to select a report file.
@@ -132,16 +254,9 @@ def choose_file():
 
     import inquirer
 
-    choices = []
-    file_paths = {}
-    directory = os.getcwd()
-
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".json") and file.startswith("review_report_"):
-                choices.append(file)
-                full_path = os.path.join(root, file)
-                file_paths[file] = full_path
+    report_files = find_report_files()
+    choices = [path.name for path in report_files]
+    file_paths = {path.name: str(path) for path in report_files}
 
     questions = [
         inquirer.List(
@@ -159,15 +274,26 @@ def choose_file():
     return selected_file
 
 
+# Built once at import, before any worker thread can log
+_LOGGER = setup_logger()
+
+
 def log_message(message, level="INFO"):
-    logger = setup_logger()
-    getattr(logger, level.lower())(message)
+    getattr(_LOGGER, level.lower())(message)
+
+
+def json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj):
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
 
 
 def load_last_processed_data():
     try:
-        with open(PROCESSED_DATA_FILE, "r") as f:
-            data = json.load(f)
+        with open(PROCESSED_DATA_FILE, "rb") as f:
+            data = json_loads(f.read())
         profile_id = data["profile_id"]
         input_file = data["input_file"]
         return profile_id, input_file
@@ -175,72 +301,218 @@ def load_last_processed_data():
         return None, None
 
 
-def save_last_processed_data(profile_id, input_file):
+def save_last_processed_data(profile_id, input_file, flush=False):
+    """Record the resume point, only writing it to disk every few profiles"""
+    global _PROCESSED_DIRTY, _PROCESSED_PENDING
+    with _SAVE_LOCK:
+        _PROCESSED_STATE["profile_id"] = profile_id
+        _PROCESSED_STATE["input_file"] = input_file
+        _PROCESSED_DIRTY = True
+        _PROCESSED_PENDING += 1
+
+        if flush or _PROCESSED_PENDING >= PROCESSED_FLUSH_EVERY:
+            _write_last_processed_data()
+
+
+def flush_last_processed_data():
+    with _SAVE_LOCK:
+        _write_last_processed_data()
+
+
+def _write_last_processed_data():
+    # Callers must hold _SAVE_LOCK
+    global _PROCESSED_DIRTY, _PROCESSED_PENDING
+    if not _PROCESSED_DIRTY:
+        return
+
     try:
-        with open(PROCESSED_DATA_FILE, "w") as f:
-            json.dump({"profile_id": profile_id, "input_file": input_file}, f)
+        data = json_dumps(_PROCESSED_STATE)
+        with open(PROCESSED_DATA_FILE, "wb") as f:
+            f.write(data)
+        _PROCESSED_DIRTY = False
+        _PROCESSED_PENDING = 0
     except:
         pass
 
 
-def get_browser_profiles():
-    """Fetch all available browser profiles"""
-    all_profiles = []
+atexit.register(flush_last_processed_data)
+
+
+def load_cached_profiles():
+    """Return the cached browser profiles if the cache is still fresh"""
+    if _PROFILES_CACHE is not None and time.monotonic() < _PROFILES_CACHE_EXPIRES:
+        return _PROFILES_CACHE
+
+    try:
+        if time.time() - os.path.getmtime(PROFILES_CACHE_FILE) > PROFILES_CACHE_TTL:
+            return None
+
+        with open(PROFILES_CACHE_FILE, "rb") as f:
+            return json_loads(f.read())
+    except:
+        return None
+
+
+def save_cached_profiles(profiles):
+    global _PROFILES_CACHE, _PROFILES_CACHE_EXPIRES
+    _PROFILES_CACHE = profiles
+    _PROFILES_CACHE_EXPIRES = time.monotonic() + PROFILES_CACHE_TTL
+
+    try:
+        with open(PROFILES_CACHE_FILE, "wb") as f:
+            f.write(json_dumps(profiles))
+    except:
+        pass
+
+
+def load_reported_reviews(profile_id):
+    """Return the set of review URLs the profile already reported"""
+    reported_reviews = set()
+    try:
+        with open(REPORTED_REVIEWS_FILE.format(profile_id=profile_id), "rb") as f:
+            for line in f:
+                try:
+                    reported_reviews.add(json_loads(line))
+                except ValueError:
+                    pass  # Line cut short by a crash mid-write
+    except OSError:
+        pass
+    return reported_reviews
+
+
+def append_reported_review(profile_id, review_url):
+    """Append one reported review URL to the profile's JSON lines file"""
+    try:
+        with open(REPORTED_REVIEWS_FILE.format(profile_id=profile_id), "ab") as f:
+            f.write(json_dumps(review_url) + b"\n")
+    except:
+        pass
+
+
+def clear_reported_reviews():
+    """Forget every profile's reported reviews, a fresh run reports them all again"""
+    pattern = Path(REPORTED_REVIEWS_FILE.format(profile_id="*"))
+    for reported_file in pattern.parent.glob(pattern.name):
+        try:
+            reported_file.unlink()
+        except OSError:
+            pass
+
+
+def get_browser_profiles(refresh=False):
+    """Fetch all available browser profiles, reusing the cached ones if fresh"""
+    return list(iter_browser_profiles(refresh))
+
 
-    def get_profile_page(url=None):
+def iter_browser_profiles(refresh=False):
+    """Yield the browser profiles as their pages arrive, cached ones if fresh"""
+    cached_profiles = None if refresh else load_cached_profiles()
+    if cached_profiles is not None:
+        yield from cached_profiles
+        return
+
+    fetch_failed = False
+
+    def get_profile_page(url=None, page=None):
+        """Return the page's (profiles, next_page_url, last_page), None if it failed"""
         try:
             url = url if url else f"{API_URL}/browser_profiles"
-            headers = {
-                "Authorization": f"Bearer {API_KEY}",
-                "Content-Type": "application/json",
-            }
             params = {"limit": PROFILE_LIMIT}
+            if page:
+                params["page"] = page
 
-            response = requests.get(url, headers=headers, params=params)
+            response = _SESSION.get(url, params=params, timeout=API_TIMEOUT)
             response.raise_for_status()
-            return response.json()["data"], response.json()["next_page_url"]
+
+            data = response.json()
+            return data["data"], data["next_page_url"], data.get("last_page")
         except Exception as e:
             log_message(
                 f"Error fetching browser profiles for url: {url}: {str(e)}", "ERROR"
             )
-            return [], None
+            return None
 
-    next_url = None
-    while True:
-        profiles, next_url = get_profile_page(next_url)
-        all_profiles = all_profiles + profiles
+    first_page = get_profile_page()
+    if first_page is None:
+        return
 
-        if not next_url:
-            break
+    all_profiles, next_url, last_page = first_page
+    yield from all_profiles
 
-    return all_profiles
+    if next_url and last_page:
+        # The page count is known, so fetch the remaining pages concurrently
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            pages = executor.map(
+                lambda page: get_profile_page(page=page), range(2, last_page + 1)
+            )
 
+            for page in pages:
+                if page is None:
+                    fetch_failed = True
+                    continue
+                profiles = page[0]
+                all_profiles.extend(profiles)
+                yield from profiles
+    else:
+        while next_url:
+            page = get_profile_page(next_url)
+            if page is None:
+                fetch_failed = True
+                break
 
-def get_selected_profiles(all_profiles):
-    try:
-        with open(SELECTED_PROFILES_FILE, "r") as f:
-            choosen_profiles = json.load(f)
+            profiles, next_url, _ = page
+            all_profiles.extend(profiles)
+            yield from profiles
 
-        if choosen_profiles == []:
-            return all_profiles
+    # Only cache complete listings
+    if not fetch_failed:
+        save_cached_profiles(all_profiles)
 
-        selected_profiles = [
-            profile for profile in all_profiles if profile["name"] in choosen_profiles
-        ]
-        return selected_profiles
+
+def get_selected_profiles(all_profiles):
+    """Filter the profiles lazily down to the selected ones, if any are selected"""
+    try:
+        with open(SELECTED_PROFILES_FILE, "rb") as f:
+            choosen_profiles = set(json_loads(f.read()))
     except:
         return all_profiles
 
+    if not choosen_profiles:
+        return all_profiles
+
+    return (
+        profile for profile in all_profiles if profile["name"] in choosen_profiles
+    )
+
+
+def resume_from_profile(profiles, profile_id):
+    """Yield the profiles starting at `profile_id`, or all of them if it's missing"""
+    skipped = []
+    profiles = iter(profiles)
+    for profile in profiles:
+        if profile.get("id", None) == profile_id:
+            yield profile
+            yield from profiles
+            return
+        skipped.append(profile)
+
+    yield from skipped
+
 
 def run_profile(profile_id, headless=False):
     """Start a browser profile"""
     try:
         is_headless_str = "&headless=true" if headless else ""
         url = f"{BASE_URL}/v1.0/browser_profiles/{profile_id}/start?automation=1{is_headless_str}"
-        response = requests.get(url)
+        response = _START_SESSION.get(url, timeout=PROFILE_START_TIMEOUT)
         response.raise_for_status()
 
         return response.json()
+    except requests.exceptions.ReadTimeout as e:
+        # The browser may still come up after we stopped waiting for it
+        log_message(f"Timed out starting profile {profile_id}: {str(e)}", "ERROR")
+        close_profile(profile_id)
+        return None
     except Exception as e:
         log_message(f"Error starting profile {profile_id}: {str(e)}", "ERROR")
         return None
@@ -250,7 +522,7 @@ def close_profile(profile_id):
     """Stop a browser profile"""
     try:
         url = f"{BASE_URL}/v1.0/browser_profiles/{profile_id}/stop"
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=LOCAL_API_TIMEOUT)
         response.raise_for_status()
 
         return response.json()
@@ -262,37 +534,102 @@ def close_all_browsers():
     """Stop all the browser profiles, used to cleanup cause some browsers still remains open"""
     all_profiles = get_browser_profiles()
     profiles = get_selected_profiles(all_profiles)
+    profile_ids = [profile["id"] for profile in profiles if profile.get("id", None)]
 
-    for profile in profiles:
-        profile_id = profile.get("id", None)
-        if profile_id:
-            close_profile(profile_id)
+    # Each stop is an independent local API call, send them side by side
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        list(executor.map(close_profile, profile_ids))
 
-def perform_automation(profile_id, reviews_to_report):
-    """
-    Main automation function for reporting reviews with human-like behavior
-    and login handling
-    """
 
-    try:
+def open_driver(profile_id):
+    """Start a browser profile and attach a driver to it, None if that fails"""
+    # Launching a browser is the heavy part, don't let every worker do it at once
+    with _START_SEMAPHORE:
         response = run_profile(profile_id, IS_HEADLESS)
-        if not response:
-            log_message(f"Failed to start profile {profile_id}", "ERROR")
-            return
+    if not response:
+        log_message(f"Failed to start profile {profile_id}", "ERROR")
+        return None
+
+    driver = None
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
         port = response["automation"]["port"]
 
         log_message(f"Connecting to profile {profile_id} at port {port}", "INFO")
         options = Options()
         options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
         driver = webdriver.Chrome(options=options)
+        return driver
+    except Exception as e:
+        log_message(f"Error connecting to profile {profile_id}: {str(e)}", "ERROR")
+        if driver:
+            try:
+                driver.quit()
+            except:
+                pass
+        close_profile(profile_id)
+        return None
+
+
+def close_driver(driver, profile_id):
+    """Detach the driver and stop its browser profile"""
+    try:
+        driver.quit()
+    except:
+        pass
+    close_profile(profile_id)
+
+
+@functools.lru_cache(maxsize=None)
+def bezier_weights(num_points):
+    """Quadratic Bezier curve weights for each of the `num_points` steps"""
+    weights = []
+    for t in range(num_points + 1):
+        t = t / num_points
+        weights.append(((1 - t) ** 2, 2 * (1 - t) * t, t**2))
+    return tuple(weights)
+
+
+def perform_automation(driver, profile_id, reviews_to_report, human_delay=False):
+    """
+    Main automation function for reporting reviews with human-like behavior
+    and login handling, using the already started profile's driver
+    """
+
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        wait = WebDriverWait(driver, 10)
+        report_failed_wait = WebDriverWait(driver, 3)
+        reported_reviews = load_reported_reviews(profile_id)
+        stopped = False
+
+        if reported_reviews:
+            log_message(
+                f"Skipping {len(reported_reviews)} reviews profile {profile_id} already reported",
+                "INFO",
+            )
+
+        # Read once, the window stays maximized after the first focus
+        viewport_size = None
 
         # Won't work in headless mode
         def human_like_mouse_movement():
+            nonlocal viewport_size
             actions = ActionChains(driver)
 
             # Get viewport size
-            viewport_width = driver.execute_script("return window.innerWidth;")
-            viewport_height = driver.execute_script("return window.innerHeight;")
+            if viewport_size is None:
+                viewport_size = driver.execute_script(
+                    "return [window.innerWidth, window.innerHeight];"
+                )
+            viewport_width, viewport_height = viewport_size
 
             def generate_bezier_curve(start_point, end_point, num_points=10):
                 # Create a random control point for the curve
@@ -303,22 +640,16 @@ def perform_automation(profile_id, reviews_to_report):
                     min(start_point[1], end_point[1]), max(start_point[1], end_point[1])
                 )
 
-                points = []
-                for t in range(num_points + 1):
-                    t = t / num_points
-                    # Quadratic Bezier curve formula
-                    x = (
-                        (1 - t) ** 2 * start_point[0]
-                        + 2 * (1 - t) * t * control_x
-                        + t**2 * end_point[0]
+                # Quadratic Bezier curve formula, with the weights cached per num_points
+                start_x, start_y = start_point
+                end_x, end_y = end_point
+                return [
+                    (
+                        int(w0 * start_x + w1 * control_x + w2 * end_x),
+                        int(w0 * start_y + w1 * control_y + w2 * end_y),
                     )
-                    y = (
-                        (1 - t) ** 2 * start_point[1]
-                        + 2 * (1 - t) * t * control_y
-                        + t**2 * end_point[1]
-                    )
-                    points.append((int(x), int(y)))
-                return points
+                    for w0, w1, w2 in bezier_weights(num_points)
+                ]
 
             # Perform several random curved movements
             current_x = current_y = 0
@@ -344,32 +675,32 @@ def perform_automation(profile_id, reviews_to_report):
                     )  # Random deviation with normal distribution
                     deviation_y = random.gauss(0, 2)
 
-                    try:
-                        actions.move_by_offset(
-                            point[0] - current_x + deviation_x,
-                            point[1] - current_y + deviation_y,
-                        ).perform()
-                    except:
-                        # Reset if we move out of bounds
-                        actions = ActionChains(driver)
-                        current_x = current_y = 0
-                        continue
-
+                    actions.move_by_offset(
+                        point[0] - current_x + deviation_x,
+                        point[1] - current_y + deviation_y,
+                    )
                     current_x, current_y = point
 
                     # Random micro pause
-                    time.sleep(random.uniform(0.01, 0.03))
+                    actions.pause(random.uniform(0.01, 0.03))
 
                 # Occasional pause between major movements
-                time.sleep(random.uniform(0.1, 0.3))
+                actions.pause(random.uniform(0.1, 0.3))
 
                 # Sometimes add a "hesitation" movement
                 if random.random() < 0.3:  # 30% chance
                     small_x = random.randint(-20, 20)
                     small_y = random.randint(-20, 20)
-                    actions.move_by_offset(small_x, small_y).perform()
-                    time.sleep(random.uniform(0.1, 0.2))
-                    actions.move_by_offset(-small_x, -small_y).perform()
+                    actions.move_by_offset(small_x, small_y)
+                    actions.pause(random.uniform(0.1, 0.2))
+                    actions.move_by_offset(-small_x, -small_y)
+
+            # Send the whole movement to the browser in a single actions command
+            try:
+                actions.perform()
+            except:
+                # Skip the movement if any of it went out of bounds
+                actions.reset_actions()
 
         def ensure_browser_focused():
             try:
@@ -391,13 +722,16 @@ def perform_automation(profile_id, reviews_to_report):
         def simulate_human_behavior():
             """Simulate human-like mouse movements and scrolling"""
             try:
-                # Random scroll with variable speed
+                # Random scroll, animated by the browser's own smooth scrolling
                 scroll_amount = random.randint(100, 300)
-                for _ in range(scroll_amount // 20):  # Smooth scrolling
-                    driver.execute_script(
-                        f"window.scrollBy(0, {20 + random.randint(-5, 5)});"
-                    )
-                    time.sleep(random.uniform(0.01, 0.03))
+                driver.execute_script(
+                    "window.scrollBy({top: arguments[0], behavior: 'smooth'});",
+                    scroll_amount,
+                )
+                # Roughly as long as the old 5-15 small scroll steps used to take
+                time.sleep(
+                    random.uniform(scroll_amount * 0.0005, scroll_amount * 0.0015)
+                )
                 time.sleep(random.uniform(0.5, 1))
 
                 if not ensure_browser_focused():
@@ -414,86 +748,73 @@ def perform_automation(profile_id, reviews_to_report):
             """Handle the login process when redirected to login page"""
             try:
                 # TODO: Handle recaptcha if possible.. wait for manual solve for now
-                account_selector = "#yDmH0d > div.gfM9Zd > div.tTmh9.NQ5OL > div.SQNfcc.WbALBb > div > div > div.Anixxd > div > div > div > form > span > section > div > div > div > div > ul > li.aZvCDf.oqdnae.W7Aapd.zpCp3.SmR8 > div"
-                loop_count = 0
-
-                while loop_count <= 30:  # Wait for 5 Min ( 5 min * 60 / 10 = 30 )
-                    try:
-                        account = WebDriverWait(driver, 10).until(
-                            EC.element_to_be_clickable(
-                                (By.CSS_SELECTOR, account_selector)
-                            )
-                        )
-                        break
-                    except:
-                        if loop_count == 0:
-                            log_message(
-                                "reCAPTCHA required... waiting until recaptcha got solved...",
-                                "WARNING",
-                            )
-                        loop_count += 1
-
-                if loop_count >= 30:
+                try:
+                    account = wait.until(EC.element_to_be_clickable(ACCOUNT_BUTTON))
+                except TimeoutException:
                     log_message(
-                        "Maximum wait time for reCAPTCHA exceeded",
-                        "ERROR",
+                        "reCAPTCHA required... waiting until recaptcha got solved...",
+                        "WARNING",
                     )
+                    try:
+                        account = WebDriverWait(
+                            driver, RECAPTCHA_TIMEOUT, poll_frequency=2.0
+                        ).until(EC.element_to_be_clickable(ACCOUNT_BUTTON))
+                    except TimeoutException:
+                        log_message(
+                            "Maximum wait time for reCAPTCHA exceeded",
+                            "ERROR",
+                        )
 
-                    return False
+                        return False
 
                 # Click first signed out account
-                account_selector = "#yDmH0d > div.gfM9Zd > div.tTmh9.NQ5OL > div.SQNfcc.WbALBb > div > div > div.Anixxd > div > div > div > form > span > section > div > div > div > div > ul > li.aZvCDf.oqdnae.W7Aapd.zpCp3.SmR8 > div"
-                account = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, account_selector))
-                )
                 simulate_human_behavior()
                 account.click()
 
                 # Handle password input
                 try:
                     password_field = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located(
-                            (
-                                By.CSS_SELECTOR,
-                                "#password > div.aCsJod.oJeWuf > div > div.Xb9hP > input",
-                            )
-                        )
+                        EC.presence_of_element_located(PASSWORD_FIELD)
                     )
                     # Let autofill handle the password
                     time.sleep(2)
 
-                    manual_login_wait_count = 0
                     if password_field.get_attribute("data-initial-value") != "":
                         log_message(
                             "Couldn't find any saved password, waiting for manual Password entry. Make sure to submit the password after entering",
                             "INFO",
                         )
-                        while True:
-                            time.sleep(5)
-                            manual_login_wait_count += 5
-
-                            if password_field.get_attribute("data-initial-value") == "":
-                                raise TimeoutException  # To make sure that password isn't submitted in the middle of entering the password
-                            if manual_login_wait_count > 240:
-                                log_message(
-                                    "Maximum wait time for manual login Exceeded",
-                                    "ERROR",
+
+                        def password_submitted(_):
+                            try:
+                                value = password_field.get_attribute(
+                                    "data-initial-value"
                                 )
-                                return False
+                                return value == ""
+                            except StaleElementReferenceException:
+                                # The password page is already gone
+                                return True
 
-                    password_field.send_keys(Keys.ENTER)
+                        # Don't press enter afterwards, the user submits it themselves
+                        try:
+                            WebDriverWait(driver, 240, poll_frequency=2).until(
+                                password_submitted
+                            )
+                        except TimeoutException:
+                            log_message(
+                                "Maximum wait time for manual login Exceeded",
+                                "ERROR",
+                            )
+                            return False
+                    else:
+                        password_field.send_keys(Keys.ENTER)
                 except TimeoutException:
                     pass
 
                 # Handle "Not now" button
                 try:
                     not_now_button = WebDriverWait(driver, 20).until(
-                        EC.element_to_be_clickable(
-                            (
-                                By.CSS_SELECTOR,
-                                "#yDmH0d > div.gfM9Zd > div.tTmh9.NQ5OL > div.SQNfcc.WbALBb > div > div > div.fby5Ed > div > div.SxkrO > div > div > button > span",
-                            )
-                        )
+                        EC.element_to_be_clickable(NOT_NOW_BUTTON)
                     )
                     not_now_button.click()
                     time.sleep(2)
@@ -505,11 +826,25 @@ def perform_automation(profile_id, reviews_to_report):
                 log_message(f"Error in login process: {str(e)}", "ERROR")
                 return False
 
+        def load_page(url):
+            """Open the url and wait until the document finished loading"""
+            driver.get(url)
+            wait.until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+            if human_delay:
+                time.sleep(random.uniform(1, 2))
+
         for review_url in reviews_to_report:
+            if _STOP_EVENT.is_set():
+                stopped = True
+                break
+            if review_url in reported_reviews:
+                continue
+
             try:
                 log_message(f"Processing review URL: {review_url[:100]}.....", "INFO")
-                driver.get(review_url)
-                time.sleep(random.uniform(1, 2))
+                load_page(review_url)
                 review_report_failed = False
 
                 # Check if redirected to login page
@@ -523,8 +858,7 @@ def perform_automation(profile_id, reviews_to_report):
                         continue
 
                     # Reload the review URL after login
-                    driver.get(review_url)
-                    time.sleep(2)
+                    load_page(review_url)
 
                     # Check if redirected to login again
                     if driver.current_url.startswith("https://accounts.google.com/v3"):
@@ -536,40 +870,23 @@ def perform_automation(profile_id, reviews_to_report):
                 simulate_human_behavior()
 
                 try:
-                    spam_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable(
-                            (
-                                By.CSS_SELECTOR,
-                                "#yDmH0d > c-wiz > div > ul > li:nth-child(2) > a",
-                            )
-                        )
-                    )
+                    spam_button = wait.until(EC.element_to_be_clickable(SPAM_BUTTON))
                     spam_button.click()
                 except Exception as e:
                     log_message(f"Error clicking spam button: {str(e)}", "ERROR")
                     continue
 
                 try:
-                    submit_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable(
-                            (
-                                By.CSS_SELECTOR,
-                                "#yDmH0d > c-wiz.zQTmif.SSPGKf.eejsDc.BE677d > div > div.mhBSmf > div > div > button > span",
-                            )
-                        )
+                    submit_button = wait.until(
+                        EC.element_to_be_clickable(SUBMIT_BUTTON)
                     )
 
                     time.sleep(0.5)
                     submit_button.click()
 
                     try:
-                        _ = WebDriverWait(driver, 3).until(
-                            EC.element_to_be_clickable(
-                                (
-                                    By.CSS_SELECTOR,
-                                    "#yDmH0d > c-wiz.zQTmif.SSPGKf.eejsDc.FDd2Le > div > div.mhBSmf > div > div > button > span",
-                                )
-                            )
+                        _ = report_failed_wait.until(
+                            EC.element_to_be_clickable(REPORT_FAILED_BUTTON)
                         )
                         review_report_failed = True
                     except:
@@ -585,19 +902,13 @@ def perform_automation(profile_id, reviews_to_report):
                         f"Review report failed trying different reason for the report...",
                         "ERROR",
                     )
-                    driver.get(review_url)
-                    time.sleep(1)
+                    load_page(review_url)
 
                     simulate_human_behavior()
 
                     try:
-                        offtopic_button = WebDriverWait(driver, 10).until(
-                            EC.element_to_be_clickable(
-                                (
-                                    By.CSS_SELECTOR,
-                                    "#yDmH0d > c-wiz > div > ul > li:nth-child(1) > a",
-                                )
-                            )
+                        offtopic_button = wait.until(
+                            EC.element_to_be_clickable(OFFTOPIC_BUTTON)
                         )
                         offtopic_button.click()
                     except Exception as e:
@@ -607,26 +918,16 @@ def perform_automation(profile_id, reviews_to_report):
                         continue
 
                     try:
-                        submit_button = WebDriverWait(driver, 10).until(
-                            EC.element_to_be_clickable(
-                                (
-                                    By.CSS_SELECTOR,
-                                    "#yDmH0d > c-wiz.zQTmif.SSPGKf.eejsDc.BE677d > div > div.mhBSmf > div > div > button > span",
-                                )
-                            )
+                        submit_button = wait.until(
+                            EC.element_to_be_clickable(SUBMIT_BUTTON)
                         )
 
                         time.sleep(0.5)
                         submit_button.click()
 
                         try:
-                            _ = WebDriverWait(driver, 3).until(
-                                EC.element_to_be_clickable(
-                                    (
-                                        By.CSS_SELECTOR,
-                                        "#yDmH0d > c-wiz.zQTmif.SSPGKf.eejsDc.FDd2Le > div > div.mhBSmf > div > div > button > span",
-                                    )
-                                )
+                            _ = report_failed_wait.until(
+                                EC.element_to_be_clickable(REPORT_FAILED_BUTTON)
                             )
                             review_report_failed = True
                         except:
@@ -650,6 +951,8 @@ def perform_automation(profile_id, reviews_to_report):
                         f"Successfully reported review for {review_url[:100]}.....",
                         "INFO",
                     )
+                    reported_reviews.add(review_url)
+                    append_reported_review(profile_id, review_url)
 
                 # Wait random time between reviews
                 time.sleep(random.uniform(2, 4))
@@ -657,23 +960,77 @@ def perform_automation(profile_id, reviews_to_report):
                 log_message(f"Error processing review URL: {str(e)}", "ERROR")
                 continue
 
-        # Clean up
-        driver.quit()
-        close_profile(profile_id)
+        if stopped:
+            log_message(
+                f"Stopped automation for profile {profile_id} before finishing",
+                "WARNING",
+            )
+            return False
+
         log_message(
             f"Successfully completed automation for profile {profile_id}", "INFO"
         )
+        return True
 
     except Exception as e:
         log_message(f"Automation error for profile {profile_id}: {str(e)}", "ERROR")
-        try:
-            driver.quit()
-        except:
-            pass
-        close_profile(profile_id)
+        return False
+
+
+def process_profile(profile, reviews_to_report, human_delay=False):
+    """
+    Run the automation for one profile, meant to be run from a worker thread.
+    Returns whether the profile went through all of its reviews.
+    """
+    profile_id = profile["id"]
+    completed = False
+    try:
+        log_message(
+            f"Processing profile '{profile['name']}' - {profile_id} ( CTRL + C to exit )",
+            "INFO",
+        )
+
+        # Start the profile once and report all of its reviews before stopping it
+        driver = open_driver(profile_id)
+        if driver is not None:
+            try:
+                completed = perform_automation(
+                    driver, profile_id, reviews_to_report, human_delay
+                )
+            finally:
+                close_driver(driver, profile_id)
+    except Exception as e:
+        log_message(f"Processing one of the profile: {str(e)}", "ERROR")
+
+    return completed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Report Google reviews using Dolphin Anty browser profiles"
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=PROFILE_WORKERS,
+        help=f"Number of profiles automated at the same time (default: {PROFILE_WORKERS})",
+    )
+    parser.add_argument(
+        "--refresh-profiles",
+        action="store_true",
+        help="Ignore the cached browser profiles and fetch them again",
+    )
+    parser.add_argument(
+        "--human-delay",
+        action="store_true",
+        help="Add a random pause after every page load",
+    )
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+
     if not all([API_KEY, BASE_URL]):
         log_message("Missing required environment variables", "CRITICAL")
         sys.exit(1)
@@ -681,7 +1038,6 @@ def main():
     try:
         resume = False
         reviews_to_report = []
-        last_processed_profile_idx = 0
         last_processed_profile, input_file = load_last_processed_data()
 
         if last_processed_profile and input_file:
@@ -703,7 +1059,11 @@ def main():
             else:
                 log_message("Starting the review process from scratch...", "INFO")
                 input_file = None
-                save_last_processed_data(None, None)
+                save_last_processed_data(None, None, flush=True)
+
+        # The reported reviews only carry over into a resumed run
+        if not resume:
+            clear_reported_reviews()
 
         if not input_file:
             input_file = choose_file()
@@ -711,8 +1071,11 @@ def main():
         if input_file is None:
             sys.exit(1)
 
-        with open(input_file, "r") as f:
-            reviews_to_report = json.load(f)
+        with open(input_file, "rb") as f:
+            reviews_to_report = json_loads(f.read())
+
+        # Drop duplicate review URLs while keeping their order
+        reviews_to_report = list(dict.fromkeys(reviews_to_report))
 
         if len(reviews_to_report) <= 0:
             log_message(
@@ -731,48 +1094,60 @@ def main():
         )
 
         # Fetch & Process all profiles / the selected profiles
-        all_profiles = get_browser_profiles()
+        all_profiles = iter_browser_profiles(refresh=args.refresh_profiles)
         profiles = get_selected_profiles(all_profiles)
 
         if resume:
-            last_processed_profile_idx = next(
-                (
-                    idx
-                    for idx, profile in enumerate(profiles)
-                    if profile.get("id", None) == last_processed_profile
-                ),
-                0,
-            )
+            profiles = resume_from_profile(profiles, last_processed_profile)
 
-        log_message(
-            f"Found {len(profiles[last_processed_profile_idx:])} profiles to process",
-            "INFO",
-        )
+        executor = ThreadPoolExecutor(max_workers=max(1, args.max_workers))
+        futures = {}
+        queued_ids = []
 
-        for profile in profiles[last_processed_profile_idx:]:
-            try:
-                profile_id = profile["id"]
-                profile_name = profile["name"]
-                log_message(
-                    f"Processing profile '{profile_name}' - {profile_id} ( CTRL + C to exit )",
-                    "INFO",
+        try:
+            # Profiles are queued while the later listing pages are still loading
+            for profile in profiles:
+                future = executor.submit(
+                    process_profile, profile, reviews_to_report, args.human_delay
                 )
-                perform_automation(profile_id, reviews_to_report)
-                time.sleep(random.uniform(1, 3))
-                save_last_processed_data(profile_id, input_file)
-            except KeyboardInterrupt:
-                raise KeyboardInterrupt
-            except Exception as e:
-                log_message(f"Processing one of the profile: {str(e)}", "ERROR")
-                # Try to save the profil_id
-                try:
-                    save_last_processed_data(profile["id"], input_file)
-                except:
-                    pass
+                futures[future] = len(queued_ids)
+                queued_ids.append(profile["id"])
+
+            log_message(f"Found {len(queued_ids)} profiles to process", "INFO")
+            if queued_ids:
+                save_last_processed_data(queued_ids[0], input_file, flush=True)
+
+            # Workers finish out of order, so the checkpoint is always the earliest
+            # profile that hasn't gone through all of its reviews yet
+            done = set()
+            first_pending = 0
+            for future in as_completed(futures):
+                if not future.result():
+                    continue
+
+                done.add(futures[future])
+                while first_pending in done:
+                    first_pending += 1
+
+                if first_pending < len(queued_ids):
+                    save_last_processed_data(queued_ids[first_pending], input_file)
+
+            if first_pending == len(queued_ids):
+                save_last_processed_data(None, None, flush=True)
+        except BaseException:
+            # On CTRL + C or any error, drop the queued profiles and let the running
+            # ones stop after their current review
+            _STOP_EVENT.set()
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            # Wait for the workers to close their own browsers before the cleanup
+            # below stops every profile
+            executor.shutdown(wait=True)
 
     except KeyboardInterrupt:
         log_message("Shutting down gracefully after closing all profiles, wait....", "INFO")
-        close_all_browsers()
     except Exception as e:
         log_message(f"Critical error in main: {e}", "CRITICAL")
         sys.exit(1)